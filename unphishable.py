@@ -1,22 +1,142 @@
 import sys
 import uuid
+import bisect
+import functools
+import importlib
+import importlib.util
+import inspect
+import time
+import threading
 import os
-from datetime import datetime
+import re
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+# Issuers of free certificates, matched case-insensitively. Short intermediate
+# names like "R3" must match exactly, paid CAs reuse them (GlobalSign ... R3 DV ...)
+_FREE_CERT_SET = frozenset(s.lower() for s in [
+    "R12", "R3 DV", "R3 EV", "R3 CA", "R3 cross-signed",
+    "R3", "R13"
+])
+# Vendor names are matched anywhere in the issuer as whole words
+_FREE_CERT_VENDORS = ["let's encrypt", "zerossl", "buypass", "cloudflare", "google trust"]
+_FREE_CERT_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(_FREE_CERT_VENDORS, key=len, reverse=True))) + r")\b"
+)
+
+# A URL scheme at the very start of the input, "://" later on may be in a query
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://")
+
+# ASCII host name without leading/trailing or doubled dots, optionally with a port
+_DOMAIN_RE = re.compile(r"(?!\.)(?!.*\.\.)[A-Za-z0-9.\-]+(?<!\.)(?::\d{1,5})?")
+
+# Common multi-label public suffixes, registry lookups never query these directly
+_PUBLIC_SUFFIXES = frozenset([
+    "co.uk", "org.uk", "me.uk", "ltd.uk", "plc.uk", "ac.uk", "gov.uk",
+    "com.au", "net.au", "org.au", "edu.au", "gov.au",
+    "com.br", "net.br", "org.br", "gov.br",
+    "co.jp", "ne.jp", "or.jp", "ac.jp",
+    "co.nz", "org.nz", "net.nz",
+    "co.za", "org.za",
+    "co.in", "net.in", "org.in", "gov.in",
+    "com.cn", "net.cn", "org.cn",
+    "com.mx", "com.ar", "com.tr", "com.sg", "com.my", "com.hk", "com.tw",
+    "co.kr", "co.id", "com.ng", "co.ke", "com.pk", "com.ph", "com.vn",
+    "com.co", "com.ua", "com.eg", "com.sa",
+])
+
+# Authoritative WHOIS servers, used when RDAP is unavailable
+_WHOIS_SERVERS = {
+    "com": "whois.verisign-grs.com",
+    "net": "whois.verisign-grs.com",
+    "org": "whois.pir.org",
+    "io": "whois.nic.io",
+    "co": "whois.nic.co",
+    "dev": "whois.nic.google",
+    "app": "whois.nic.google",
+    "xyz": "whois.nic.xyz",
+    "info": "whois.nic.info",
+    "me": "whois.nic.me",
+}
+_WHOIS_CREATED_RE = re.compile(rb"Creation Date:\s*(\S+)")
+_WHOIS_EXPIRES_RE = re.compile(rb"Registry Expiry Date:\s*(\S+)")
+
+# ANSI color prefixes for print_message, colorama translates them on Windows
+_ANSI = {
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+    "cyan": "\x1b[36m",
+    "white": "\x1b[37m"
+}
+_RESET = "\x1b[0m"
+
+# (upper age bound in months, risk level), checked in order
+_AGE_RISK_BUCKETS = [
+    (12, "🔴 High: DOMAIN age to low ❗"),
+    (36, "🟠 medium: not to young but browse cautiously ⚠️"),
+    (float("inf"), "🟢 low: domain is old enough and safe ✅"),
+]
+_AGE_RISK_LIMITS = [limit for limit, _ in _AGE_RISK_BUCKETS[:-1]]
+
+# Risk factor -> explanation shown in the risk analysis panel
+_FACTOR_EXPLANATIONS = {
+    "redirect": "🔄 Redirects can hide final destination",
+    "privacy": "🛡️ WHOIS privacy masks domain ownership",
+    "free_ssl": "🔓 Free SSL common in phishing campaigns",
+    "invalid_ssl": "❌ Missing SSL indicates poor security",
+    "new_domain": "🆕 New domains are riskier (often <1 year)",
+    "unreachable": "📡 Domain may be fake or taken down"
+}
+
+# (upper score bound, icon, summary), checked in order
+_RISK_BUCKETS = [
+    (10, "📈", "Minimal risk indicators detected."),
+    (20, "📈", "Some low-risk factors present."),
+    (30, "⚠️", "Multiple suspicious factors detected."),
+    (float("inf"), "🚨", "High concentration of risk factors."),
+]
+
+def _verdict_for(score):
+    """Return the (icon, summary) of the risk bucket a score falls into"""
+    for limit, icon, summary in _RISK_BUCKETS:
+        if score < limit:
+            return icon, summary
 
 # ============================================
 # ENHANCED AUTO-INSTALL WITH CONSOLE FALLBACKS
 # ============================================
 
+class _NoColor:
+    """Stand-in for colorama.Fore when colorama is unavailable"""
+    RED = GREEN = YELLOW = CYAN = WHITE = ""
+
+class _NoStyle:
+    """Stand-in for colorama.Style when colorama is unavailable"""
+    RESET_ALL = ""
+
 class ConsoleManager:
     """Handle console output with fallbacks"""
+    __slots__ = ("has_colorama", "has_rich", "Fore", "Style", "console", "Panel", "Table", "Text")
+    
     def __init__(self):
         self.has_colorama = False
-        self.has_rich = False
+        self.has_rich = None  # unknown until rich is first needed
+        self.Fore = None
+        self.Style = None
+        # Rich is heavy to import, defer it until something is displayed
+        self.console = None
+        self.Panel = None
+        self.Table = None
+        self.Text = None
         self.setup_consoles()
     
     def setup_consoles(self):
         """Try to load console libraries, install if missing"""
-        # Try colorama first
+        # Try colorama first, probing for it doesn't run any of its code
+        if importlib.util.find_spec("colorama") is None:
+            self.install_package("colorama")
+            importlib.invalidate_caches()
         try:
             from colorama import init, Fore, Style
             init(autoreset=True)
@@ -25,65 +145,58 @@ class ConsoleManager:
             self.has_colorama = True
             self.print_message("✅ Colorama loaded", "green")
         except ImportError:
-            self.install_package("colorama")
+            self.Fore = _NoColor
+            self.Style = _NoStyle
+    
+    def _get_rich(self):
+        """Load rich on first use, return True if available"""
+        if self.has_rich is None:
             try:
-                from colorama import init, Fore, Style
-                init(autoreset=True)
-                self.Fore = Fore
-                self.Style = Style
-                self.has_colorama = True
-            except:
-                self.Fore = type('obj', (object,), {'RED': '', 'GREEN': '', 'YELLOW': '', 'CYAN': '', 'WHITE': ''})
-                self.Style = type('obj', (object,), {'RESET_ALL': ''})
-        
-        # Try rich for advanced features
-        try:
-            from rich.console import Console
-            from rich.panel import Panel
-            from rich.table import Table
-            self.console = Console()
-            self.Panel = Panel
-            self.Table = Table
-            self.has_rich = True
-            self.print_message("✅ Rich console loaded", "green")
-        except ImportError:
-            # Don't auto-install rich (optional)
-            self.console = None
-            self.Panel = None
-            self.Table = None
+                from rich.console import Console
+                from rich.panel import Panel
+                from rich.table import Table
+                from rich.text import Text
+                self.console = Console()
+                self.Panel = Panel
+                self.Table = Table
+                self.Text = Text
+                self.has_rich = True
+                self.print_message("✅ Rich console loaded", "green")
+            except ImportError:
+                # Don't auto-install rich (optional)
+                self.has_rich = False
+        return self.has_rich
     
-    def install_package(self, package):
-        """Install a Python package"""
-        self.print_message(f"📦 Installing {package}...", "yellow")
+    def install_package(self, *packages):
+        """Install one or more Python packages with a single pip run"""
+        names = ", ".join(packages)
+        self.print_message(f"📦 Installing {names}...", "yellow")
         try:
             import subprocess
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package, "--quiet"])
-            self.print_message(f"✅ Installed: {package}", "green")
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install", *packages,
+                "--quiet", "--disable-pip-version-check", "--no-input"
+            ])
+            self.print_message(f"✅ Installed: {names}", "green")
             return True
         except:
-            self.print_message(f"❌ Failed to install: {package}", "red")
+            self.print_message(f"❌ Failed to install: {names}", "red")
             return False
     
     def print_message(self, text, color="white"):
         """Print message with color if available"""
         if self.has_colorama:
-            colors = {
-                "red": self.Fore.RED,
-                "green": self.Fore.GREEN,
-                "yellow": self.Fore.YELLOW,
-                "cyan": self.Fore.CYAN,
-                "white": self.Fore.WHITE
-            }
-            print(f"{colors.get(color, self.Fore.WHITE)}{text}{self.Style.RESET_ALL}")
+            sys.stdout.write(_ANSI.get(color, _ANSI["white"]) + text + _RESET + "\n")
         else:
             print(text)
     
     def display_banner(self):
         """Display enhanced banner"""
-        if self.has_rich and self.console:
-            from rich.text import Text
-            banner_text = Text("🔐 PHISHING DOMAIN SCANNER 🔍", style="bold cyan")
-            subtitle = Text("Professional Security Analysis Tool", style="dim")
+        # Don't load rich just for the startup banner, it's imported on the first
+        # scan's explanation panel and used here from then on (e.g. after clear)
+        if self.has_rich:
+            banner_text = self.Text("🔐 PHISHING DOMAIN SCANNER 🔍", style="bold cyan")
+            subtitle = self.Text("Professional Security Analysis Tool", style="dim")
             
             self.console.print("\n")
             self.console.rule("[bold cyan]Security Scanner[/bold cyan]")
@@ -100,41 +213,19 @@ class ConsoleManager:
     
     def display_explanation(self, risk_score, factors):
         """Display risk explanation after verdict"""
-        if self.has_rich and self.console:
-            from rich.panel import Panel
-            from rich.text import Text
-            
-            # Create explanation text
-            explanation_lines = []
-            
+        if self._get_rich():
             # Score context
-            if risk_score < 10:
-                explanation_lines.append("📈 Minimal risk indicators detected.")
-            elif risk_score < 20:
-                explanation_lines.append("📈 Some low-risk factors present.")
-            elif risk_score < 30:
-                explanation_lines.append("⚠️ Multiple suspicious factors detected.")
-            else:
-                explanation_lines.append("🚨 High concentration of risk factors.")
-            
-            # Factor explanations
-            factor_explanations = {
-                "redirect": "🔄 Redirects can hide final destination",
-                "privacy": "🛡️ WHOIS privacy masks domain ownership",
-                "free_ssl": "🔓 Free SSL common in phishing campaigns",
-                "invalid_ssl": "❌ Missing SSL indicates poor security",
-                "new_domain": "🆕 New domains are riskier (often <1 year)",
-                "unreachable": "📡 Domain may be fake or taken down"
-            }
+            icon, summary = _verdict_for(risk_score)
+            explanation_lines = [f"{icon} {summary}"]
             
             # Add relevant factor explanations
-            for factor, explanation in factor_explanations.items():
-                if factor in str(factors).lower():
-                    explanation_lines.append(explanation)
+            for factor in factors:
+                if factor in _FACTOR_EXPLANATIONS:
+                    explanation_lines.append(_FACTOR_EXPLANATIONS[factor])
             
             # Create panel
             explanation_text = "\n".join(explanation_lines)
-            panel = Panel(
+            panel = self.Panel(
                 explanation_text,
                 title="📋 Risk Analysis",
                 border_style="cyan",
@@ -147,55 +238,55 @@ class ConsoleManager:
             print("📋 RISK ANALYSIS:")
             print(f"{'─'*40}")
             
-            if risk_score < 10:
-                print("• Minimal risk indicators detected.")
-            elif risk_score < 20:
-                print("• Some low-risk factors present.")
-            elif risk_score < 30:
-                print("• Multiple suspicious factors detected.")
-            else:
-                print("• High concentration of risk factors.")
+            print(f"• {_verdict_for(risk_score)[1]}")
             
             # Simple factor display
             if factors:
                 print("\nKey Factors:")
-                for factor in str(factors).split(','):
-                    if factor.strip():
-                        print(f"  • {factor.strip()}")
+                for factor in factors:
+                    print(f"  • {factor}")
 
 # Initialize console manager
 console_mgr = ConsoleManager()
 
+# Verdict lines with colors baked in, Fore/Style are empty strings without colorama
+_r, _y, _g, _x = console_mgr.Fore.RED, console_mgr.Fore.YELLOW, console_mgr.Fore.GREEN, console_mgr.Style.RESET_ALL
+_VERDICT = {
+    "high": f"{_r}🔴 High Risk: 90% of legitimate websites used paid certificates...🚨{_x}",
+    "med": f"{_y}🟠 medium risk: manually check domain before use...⚠️{_x}",
+    "low": f"{_g}🟢 safe: domain is safe..✅{_x}"
+}
+del _r, _y, _g, _x
+
 # ============================================
 # AUTO-INSTALL CORE PACKAGES
 # ============================================
 
 def install_core_packages():
     """Install essential packages"""
-    required_packages = ["requests", "python-whois"]
+    # pip package name -> import name
+    required_packages = {"requests": "requests"}
     
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
+    # Only probe for the modules, they are imported on first scan
+    missing = []
+    for package, module in required_packages.items():
+        if importlib.util.find_spec(module) is not None:
             console_mgr.print_message(f"✅ {package} already installed", "green")
-        except ImportError:
-            console_mgr.install_package(package)
+        else:
+            missing.append(package)
     
-    # Try to import after installation
-    global requests, ssl, socket, whois, urlparse
-    try:
-        import requests
-        import ssl
-        import socket
-        import whois
-        from urllib.parse import urlparse
-        console_mgr.print_message("✅ All core packages loaded", "green")
-        return True
-    except ImportError as e:
-        console_mgr.print_message(f"❌ Critical error: {e}", "red")
-        return False
-
-# Install and import core packages
+    # One pip run for everything, pip's own startup dominates install time
+    if missing:
+        console_mgr.install_package(*missing)
+        importlib.invalidate_caches()
+    for module in required_packages.values():
+        if importlib.util.find_spec(module) is None:
+            console_mgr.print_message(f"❌ Critical error: No module named '{module}'", "red")
+            return False
+    console_mgr.print_message("✅ All core packages available", "green")
+    return True
+
+# Install core packages
 if not install_core_packages():
     sys.exit(1)
 
@@ -203,34 +294,125 @@ if not install_core_packages():
 # YOUR EXACT MODULES (UNCHANGED - COPIED VERBATIM)
 # ============================================
 
+def _ttl_cache(ttl_seconds=300, maxsize=256, cache_if=None):
+    """Memoize a function by its arguments, entries expire after ttl_seconds.
+    
+    If cache_if is given, only results for which it returns True are stored.
+    """
+    def decorator(func):
+        cache = {}
+        
+        def lookup(key, now):
+            entry = cache.pop(key, None)
+            if entry is not None and now - entry[1] < ttl_seconds:
+                # Re-insert so the dict stays ordered oldest -> newest
+                cache[key] = entry
+                return entry
+            return None
+        
+        def store(key, value, now):
+            if cache_if is not None and not cache_if(value):
+                return
+            cache[key] = (value, now)
+            if len(cache) > maxsize:
+                cache.pop(next(iter(cache)), None)
+        
+        if inspect.iscoroutinefunction(func):
+            # Cache the awaited result, a coroutine object can only be awaited once
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = (args, tuple(sorted(kwargs.items())))
+                now = time.monotonic()
+                entry = lookup(key, now)
+                if entry is not None:
+                    return entry[0]
+                value = await func(*args, **kwargs)
+                store(key, value, now)
+                return value
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = (args, tuple(sorted(kwargs.items())))
+                now = time.monotonic()
+                entry = lookup(key, now)
+                if entry is not None:
+                    return entry[0]
+                value = func(*args, **kwargs)
+                store(key, value, now)
+                return value
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+@_ttl_cache()
 def parse_domain(user_input):
     try:
         if not user_input or not user_input.strip():
             return False, "❌ No input provided"
         user_input = user_input.strip()
-        parsed = urlparse(user_input)
-        if parsed.scheme:
-            domain = parsed.netloc
+        if _SCHEME_RE.match(user_input):
+            parsed = urlparse(user_input)
         else:
             parsed = urlparse("http://" + user_input)
-            domain = parsed.netloc
+        domain = parsed.netloc
         if not domain:
             return False, "❌ invalid url or domain"
         if "." not in domain:
             return False, "❌ invalid domain format"
-        if domain.startswith('.') or domain.endswith('.'):
+        try:
+            # Check internationalized hosts in their ASCII (punycode) form
+            ascii_domain = domain.encode("idna").decode()
+        except UnicodeError:
+            return False, "❌ invalid url pattern"
+        if not _DOMAIN_RE.fullmatch(ascii_domain):
             return False, "❌ invalid url pattern"
-        if '..' in domain:
-            return False, "❌ wrong domain format"
         return True, domain.lower()
     except Exception as e:
         return False, f"❌ unexpected parsing error: {e}"
 
+_requests = None
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _get_requests():
+    """Import requests on first use"""
+    global _requests
+    if _requests is None:
+        import requests
+        import urllib3
+        # Disable SSL warnings
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        _requests = requests
+    return _requests
+
+def _get_session():
+    """Create the shared keep-alive session on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            requests = _get_requests()
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+            session.headers.update({"User-Agent": "unphishable/1.0"})
+            _SESSION = session
+    return _SESSION
+
+# Failed checks are not cached so a rescan after a network blip retries them
+@_ttl_cache(cache_if=lambda result: result[0] != "unreachable")
 def http_status_check(domain, timeout=5):
+    requests = _get_requests()
     if not domain.startswith(("http://", "https://")):
         domain = "https://" + domain
     try:
-        response = requests.get(domain, timeout=timeout, allow_redirects=False)
+        # Only the status line matters, don't download the page body
+        session = _get_session()
+        response = session.head(domain, timeout=timeout, allow_redirects=False)
+        # Many servers reject HEAD (403/404/405/501) but serve GET fine, retry those
+        if response.status_code >= 400:
+            response = session.get(domain, timeout=timeout, allow_redirects=False, stream=True)
+            response.close()
         status_code = response.status_code
         if 200 <= status_code < 300:
             return "reachable", status_code
@@ -241,53 +423,135 @@ def http_status_check(domain, timeout=5):
     except requests.exceptions.RequestException:
         return "unreachable", None
 
-def ssl_check(domain):
+@_ttl_cache(cache_if=lambda result: result[0] == "valid")
+async def ssl_check_async(domain, timeout=5):
     if not domain.startswith("https://"):
         domain = "https://" + domain
-    host = domain.replace("https://", "").split('/')[0]
+    host = urlparse(domain).hostname
     
+    import asyncio
+    import ssl
     try:
         context = ssl.create_default_context()
-        with socket.create_connection((host, 443), timeout=10) as sock:
-            with context.wrap_socket(sock, server_hostname=host) as ssock:
-                cert = ssock.getpeercert()
-                issuer = dict(x[0] for x in cert['issuer']).get('commonName', 'Unknown')
-                expiry_str = cert.get('notAfter')
-                expiry = datetime.strptime(cert['notAfter'], "%b %d %H:%M:%S %Y %Z")
-                return "valid", issuer, expiry
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, 443, ssl=context), timeout=timeout
+        )
+        try:
+            cert = writer.get_extra_info('peercert')
+            issuer = dict(x[0] for x in cert['issuer']).get('commonName', 'Unknown')
+            expiry = datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc)
+            return "valid", issuer, expiry
+        finally:
+            writer.close()
+            try:
+                # Finish the TLS close_notify here instead of at loop shutdown
+                await asyncio.wait_for(writer.wait_closed(), timeout=timeout)
+            except Exception:
+                # A failed shutdown doesn't change what the certificate said
+                pass
     except Exception:
         return "invalid", None, None
 
+def _registry_candidates(domain):
+    """List the host and its parent domains, longest first, never a bare public suffix"""
+    labels = urlparse("//" + domain).hostname.rstrip(".").split(".")
+    candidates = []
+    for i in range(len(labels) - 1):
+        candidate = ".".join(labels[i:])
+        if candidate in _PUBLIC_SUFFIXES:
+            break
+        candidates.append(candidate)
+    return candidates
+
+def _parse_registry_date(value):
+    """Parse an ISO 8601 registry timestamp"""
+    # fromisoformat() only accepts a trailing "Z" from Python 3.11
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+@functools.lru_cache(maxsize=512)
+def _rdap_fetch(domain):
+    """Query RDAP for a domain, return (creation, expiry) datetimes.
+    
+    Raises LookupError when RDAP has no record for this exact name (any 4xx).
+    Raising rather than returning keeps the answer out of the lru_cache, so a
+    transient 403/429 is retried on the next scan.
+    """
+    response = _get_session().get(f"https://rdap.org/domain/{domain}", timeout=5)
+    if 400 <= response.status_code < 500:
+        raise LookupError(f"RDAP {response.status_code} for {domain}")
+    response.raise_for_status()
+    events = {}
+    for event in response.json().get("events", []):
+        action = event.get("eventAction")
+        if action in ("registration", "expiration") and event.get("eventDate"):
+            events[action] = _parse_registry_date(event["eventDate"])
+    return events.get("registration"), events.get("expiration")
+
+def _whois_tcp(server, domain, timeout=5):
+    """Query a WHOIS server on port 43, return (creation, expiry) datetimes or None"""
+    import socket
+    chunks = []
+    with socket.create_connection((server, 43), timeout=timeout) as sock:
+        sock.sendall(domain.encode("idna") + b"\r\n")
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    response = b"".join(chunks)
+    dates = []
+    for pattern in (_WHOIS_CREATED_RE, _WHOIS_EXPIRES_RE):
+        match = pattern.search(response)
+        dates.append(_parse_registry_date(match.group(1).decode()) if match else None)
+    return tuple(dates)
+
+@functools.lru_cache(maxsize=256)
+def _age_risk(age_days):
+    """Return (age_months, age_years, risk) for a domain age_days old"""
+    age_months = age_days // 30
+    idx = bisect.bisect_right(_AGE_RISK_LIMITS, age_months)
+    return age_months, age_months // 12, _AGE_RISK_BUCKETS[idx][1]
+
+@_ttl_cache(cache_if=lambda result: result is not None)
 def domain_age_whois(domain: str):
     try:
-        w = whois.whois(domain)
-        creation = w.creation_date
-        expiry = w.expiration_date
+        # Start at the shortest candidate, usually the registered domain, and only
+        # go deeper when RDAP has no record for it
+        candidates = _registry_candidates(domain)
+        dates = None
+        try:
+            for candidate in reversed(candidates):
+                try:
+                    dates = _rdap_fetch(candidate)
+                    break
+                except LookupError:
+                    continue
+        except Exception:
+            # Network errors and 5xx: RDAP is unavailable, try port 43 instead
+            dates = None
         
-        if isinstance(creation, list):
-            creation = creation[0]
-        if isinstance(expiry, list):
-            expiry = expiry[0]
+        if dates is None:
+            # Ask the registry directly for TLDs we know, give up otherwise
+            if not candidates:
+                return None
+            apex = candidates[-1]
+            server = _WHOIS_SERVERS.get(apex.rsplit(".", 1)[-1])
+            if server is None:
+                return None
+            dates = _whois_tcp(server, apex)
+        creation, expiry = dates
         
         if not isinstance(creation, datetime) or not isinstance(expiry, datetime):
             return None
         
-        if creation.tzinfo:
-            creation = creation.replace(tzinfo=None)
-        if expiry.tzinfo:
-            expiry = expiry.replace(tzinfo=None)
+        # Registries report UTC, keep everything tz-aware
+        if creation.tzinfo is None:
+            creation = creation.replace(tzinfo=timezone.utc)
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
         
-        now = datetime.utcnow()
-        delta = now - creation
-        age_months = delta.days // 30
-        age_years = age_months // 12
-        
-        if age_months < 12:
-            risk = "🔴 High: DOMAIN age to low ❗"
-        elif 12 <= age_months < 36:
-            risk = "🟠 medium: not to young but browse cautiously ⚠️"
-        else:
-            risk = "🟢 low: domain is old enough and safe ✅"
+        now = datetime.now(timezone.utc)
+        age_months, age_years, risk = _age_risk((now - creation).days)
         
         return {
             "creation_date": creation,
@@ -303,6 +567,50 @@ def domain_age_whois(domain: str):
 # MAIN DRIVER - YOUR EXACT CODE WITH ADDITIONS
 # ============================================
 
+def _run_blocking(func, *args):
+    """Run a blocking call on its own daemon thread, return an asyncio future for it"""
+    # HTTP and WHOIS go through blocking calls and still need threads. Executor
+    # workers are joined by asyncio.run() and at interpreter exit, so a lookup
+    # abandoned after an unreachable HTTP result would hold up the next scan or
+    # the exit command. A daemon thread is simply left to finish on its own.
+    import asyncio
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+    
+    def target():
+        try:
+            callback = (future.set_result, func(*args))
+        except Exception as e:
+            callback = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(deliver, *callback)
+        except RuntimeError:
+            # The scan already finished and closed its loop, nobody wants this result
+            pass
+    
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+async def _run_checks(domain):
+    """Run HTTP, SSL and WHOIS checks concurrently on one event loop"""
+    import asyncio
+    http_task = _run_blocking(http_status_check, domain)
+    ssl_task = asyncio.ensure_future(ssl_check_async(domain))
+    whois_task = _run_blocking(domain_age_whois, domain)
+    
+    status, code = await http_task
+    if status == "unreachable":
+        ssl_task.cancel()
+        whois_task.cancel()
+        return (status, code), None, None
+    
+    ssl_result, whois_result = await asyncio.gather(ssl_task, whois_task)
+    return (status, code), ssl_result, whois_result
+
 def main():
     """Main function - your exact code wrapped"""
     console_mgr.display_banner()
@@ -322,7 +630,11 @@ def main():
                 break
             
             if user_input.lower() == "clear":
-                os.system("cls" if os.name == "nt" else "clear")
+                if os.environ.get("TERM") == "dumb":
+                    os.system("cls" if os.name == "nt" else "clear")
+                else:
+                    # Clear screen and home the cursor, colorama translates this on Windows
+                    print("\x1b[2J\x1b[H", end="")
                 console_mgr.display_banner()
                 continue
             
@@ -341,9 +653,13 @@ def main():
             scan_id = str(uuid.uuid4())
             console_mgr.print_message(f"  🆔 scan recorded! UUID:{scan_id}", "cyan")
             
+            # Run all network checks at once, results are printed in order below.
+            # asyncio is slow to import, so it is only loaded on the first scan.
+            import asyncio
+            (status, code), ssl_result, whois_result = asyncio.run(_run_checks(domain))
+            
             # ========== STEP 2: HTTP Check ==========
             console_mgr.print_message(f"\n🌐 HTTP CHECK starting...", "cyan")
-            status, code = http_status_check(domain)
             
             if status == "unreachable":
                 console_mgr.print_message(f"  🔴 HTTP UNREACHABLE: Servers down try again later..", "red")
@@ -358,17 +674,14 @@ def main():
             
             # ========== STEP 3: SSL Check ==========
             console_mgr.print_message(f"\n🔐 SSL check starting...", "cyan")
-            ssl_status, issuer, expiry = ssl_check(domain)
-            
-            free_cert_list = ["R12", "R3 DV", "R3 EV", "R3 CA", "R3 cross-signed", 
-                             "let's encrypt", "R3", "R13", "zerossl", "buypass", 
-                             "cloudflare", "google trust"]
+            ssl_status, issuer, expiry = ssl_result
             
             risk_score = 0
             risk_factors = []
             
             if ssl_status == "valid" and issuer:
-                is_free = issuer in free_cert_list
+                issuer_lower = issuer.lower()
+                is_free = issuer_lower in _FREE_CERT_SET or bool(_FREE_CERT_RE.search(issuer_lower))
                 
                 if is_free:
                     console_mgr.print_message(f"  🌏  status: valid ", "yellow")
@@ -388,7 +701,6 @@ def main():
             
             # ========== STEP 4: WHOIS Check ==========
             console_mgr.print_message(f"\n📅 Domain age check starting...", "cyan")
-            whois_result = domain_age_whois(domain)
             
             if whois_result is None:
                 console_mgr.print_message(f"  ⚠️  couldn't get domain age. (privacy activated)", "yellow")
@@ -414,11 +726,11 @@ def main():
             
             # Determine verdict with emojis
             if risk_score >= 20:
-                final_verdict = f"{console_mgr.Fore.RED if console_mgr.has_colorama else ''}🔴 High Risk: 90% of legitimate websites used paid certificates...🚨{console_mgr.Style.RESET_ALL if console_mgr.has_colorama else ''}"
+                final_verdict = _VERDICT["high"]
             elif risk_score >= 17:
-                final_verdict = f"{console_mgr.Fore.YELLOW if console_mgr.has_colorama else ''}🟠 medium risk: manually check domain before use...⚠️{console_mgr.Style.RESET_ALL if console_mgr.has_colorama else ''}"
+                final_verdict = _VERDICT["med"]
             else:
-                final_verdict = f"{console_mgr.Fore.GREEN if console_mgr.has_colorama else ''}🟢 safe: domain is safe..✅{console_mgr.Style.RESET_ALL if console_mgr.has_colorama else ''}"
+                final_verdict = _VERDICT["low"]
             
             console_mgr.print_message(f"  🔰 Risk Score: {risk_score}", "cyan")
             console_mgr.print_message(f"  ♻️  Verdict: {final_verdict}", "cyan")
@@ -439,10 +751,6 @@ def main():
             console_mgr.print_message(f"\n❌ Unexpected error: {e}", "red")
 
 if __name__ == "__main__":
-    # Disable SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
     try:
         main()
     except Exception as e: